@@ -0,0 +1,59 @@
+import json
+
+from django.core.paginator import Paginator
+from django.db import DatabaseError, OperationalError, connections, transaction
+from django.utils.functional import cached_property
+
+
+class TimeoutPaginator(Paginator):
+    timeout_ms = 200
+
+    def __init__(self, *args, page_number: int = 1, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.page_number = max(page_number, 1)
+
+    @cached_property
+    def count(self) -> int:
+        using = getattr(self.object_list, "db", None)
+        if using is None or connections[using].vendor != "postgresql":
+            return super().count
+
+        try:
+            with transaction.atomic(using=using):
+                with connections[using].cursor() as cursor:
+                    cursor.execute("SELECT current_setting('statement_timeout')")
+                    previous = cursor.fetchone()[0]
+                    cursor.execute(
+                        "SELECT set_config('statement_timeout', %s, true)",
+                        [str(self.timeout_ms)],
+                    )
+                    count = super().count
+                    # Inside an outer transaction this block is only a
+                    # savepoint, and a transaction-local setting outlives its
+                    # release; restore it so later queries are not capped
+                    cursor.execute(
+                        "SELECT set_config('statement_timeout', %s, true)",
+                        [previous],
+                    )
+                return count
+        except OperationalError:
+            # Never report fewer rows than it takes to reach the next page
+            reachable = self.per_page * self.page_number + 1
+            return max(self.estimated_count(using) or 0, reachable)
+
+    def estimated_count(self, using: str) -> int | None:
+        # Planner row estimate for the filtered queryset; nothing is executed
+        sql, params = (
+            self.object_list.order_by().query.get_compiler(using=using).as_sql()
+        )
+        try:
+            with transaction.atomic(using=using):
+                with connections[using].cursor() as cursor:
+                    cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                    plan = cursor.fetchone()[0]
+        except DatabaseError:
+            return None
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
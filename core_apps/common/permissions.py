@@ -1,30 +1,31 @@
+import sys
+from functools import lru_cache
+
 from rest_framework import permissions
 from rest_framework.request import Request
 from rest_framework.views import View
 
+__all__ = ["IsParent", "IsTeacher", "IsOfficeStaff", "role_required"]
+
+_PARENT = "parent"
+_TEACHER = "teacher"
+_STAFF = "office_staff"
 
-class IsParent(permissions.BasePermission):
-    def has_permission(self, request: Request, view: View) -> bool:
-        is_authenticated = request.user.is_authenticated
-        has_role_attr = hasattr(request.user, "role")
-        return (
-            is_authenticated
-            and has_role_attr
-            and request.user.role == "parent"
-        )
 
+class _RoleRequired(permissions.BasePermission):
+    required_role: str = ""
 
-class IsTeacher(permissions.BasePermission):
     def has_permission(self, request: Request, view: View) -> bool:
-        is_authenticated = request.user.is_authenticated
-        has_role_attr = hasattr(request.user, "role")
-        return is_authenticated and has_role_attr and request.user.role == "teacher"
+        user = request.user
+        return user.is_authenticated and getattr(user, "role", None) == self.required_role
 
 
-class IsOfficeStaff(permissions.BasePermission):
-    def has_permission(self, request: Request, view: View) -> bool:
-        is_authenticated = request.user.is_authenticated
-        has_role_attr = hasattr(request.user, "role")
-        return (
-            is_authenticated and has_role_attr and request.user.role == "office_staff"
-        )
\ No newline at end of file
+@lru_cache(maxsize=None)
+def role_required(role: str) -> type[_RoleRequired]:
+    name = "Is" + "".join(part.title() for part in role.split("_"))
+    return type(name, (_RoleRequired,), {"required_role": sys.intern(role)})
+
+
+IsParent = role_required(_PARENT)
+IsTeacher = role_required(_TEACHER)
+IsOfficeStaff = role_required(_STAFF)
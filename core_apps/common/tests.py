@@ -0,0 +1,53 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.paginator import Paginator
+from django.db import OperationalError, connections
+from django.test import TestCase
+
+from core_apps.common.paginators import TimeoutPaginator
+
+User = get_user_model()
+
+
+class TimeoutPaginatorTests(TestCase):
+    def setUp(self):
+        for i in range(3):
+            User.objects.create(
+                email=f"user{i}@example.com",
+                username=f"TS-USER{i:04d}",
+                first_name="Test",
+                last_name=f"User{i}",
+                id_no=2000 + i,
+                security_question=User.SecurityQuestions.MAIDEN_NAME,
+                security_answer="Smith",
+            )
+
+    def test_counts_exactly_on_other_backends(self):
+        paginator = TimeoutPaginator(User.objects.order_by("pk"), 2)
+
+        with mock.patch.object(connections["default"], "vendor", "sqlite"):
+            self.assertEqual(paginator.count, 3)
+
+    def test_timeout_falls_back_to_planner_estimate(self):
+        paginator = TimeoutPaginator(User.objects.order_by("pk"), 2)
+
+        with mock.patch.object(
+            Paginator, "count", new_callable=mock.PropertyMock
+        ) as count, mock.patch.object(
+            TimeoutPaginator, "estimated_count", return_value=500
+        ):
+            count.side_effect = OperationalError("canceling statement")
+            self.assertEqual(paginator.count, 500)
+
+    def test_timeout_keeps_next_page_reachable_without_estimate(self):
+        paginator = TimeoutPaginator(User.objects.order_by("pk"), 10, page_number=3)
+
+        with mock.patch.object(
+            Paginator, "count", new_callable=mock.PropertyMock
+        ) as count, mock.patch.object(
+            TimeoutPaginator, "estimated_count", return_value=None
+        ):
+            count.side_effect = OperationalError("canceling statement")
+            self.assertEqual(paginator.count, 31)
+            self.assertEqual(paginator.num_pages, 4)
@@ -1,8 +1,10 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import PAGE_VAR
 from django.utils.translation import gettext_lazy as _
 from core_apps.student import models as StudentModels
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from core_apps.common.paginators import TimeoutPaginator
 
 User = get_user_model()
 
@@ -19,6 +21,10 @@ class StudentAdmin(admin.ModelAdmin):
         "has_sibling",
         "get_verified_by",
     ]
+    list_select_related = ("parent", "verified_by")
+    autocomplete_fields = ["parent", "verified_by"]
+    paginator = TimeoutPaginator
+    show_full_result_count = False
     list_filter = [
         "account_status",
         "has_sibling",
@@ -80,6 +86,21 @@ class StudentAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_paginator(
+        self, request, queryset, per_page, orphans=0, allow_empty_first_page=True
+    ):
+        try:
+            page_number = int(request.GET.get(PAGE_VAR, 1))
+        except ValueError:
+            page_number = 1
+        return self.paginator(
+            queryset,
+            per_page,
+            orphans,
+            allow_empty_first_page,
+            page_number=page_number,
+        )
+
     def get_verified_by(self, obj):
         return obj.verified_by.full_name if obj.verified_by else "-"
 
@@ -87,7 +108,7 @@ class StudentAdmin(admin.ModelAdmin):
     get_verified_by.admin_order_field = "verified_by__first_name"
 
     def get_queryset(self, request):
-        qs = super().get_queryset(request)
+        qs = super().get_queryset(request).select_related("parent", "verified_by")
         if request.user.is_superuser:
             return qs
 
@@ -100,19 +121,25 @@ class StudentAdmin(admin.ModelAdmin):
 
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         if db_field.name == "verified_by":
-            kwargs["queryset"] = User.objects.filter(is_staff=True)
+            # Only validates the submitted id and renders the selected option;
+            # the staff restriction comes from the field's limit_choices_to.
+            # User.__str__ reads the name fields and role; defer the rest
+            kwargs["queryset"] = User.objects.only(
+                "pk", "first_name", "last_name", "email", "role"
+            )
 
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
     def save_model(self, request, obj, form, change):
         # Determine if verified_by changed or needs setting
-        prev_verified_by = None
-        if change and obj.pk:
-            try:
-                prev = StudentModels.Student.objects.get(pk=obj.pk)
-                prev_verified_by = prev.verified_by
-            except StudentModels.Student.DoesNotExist:
-                prev_verified_by = None
+        # Only hit the DB when the form reports verified_by as edited
+        prev_verified_by_id = obj.verified_by_id
+        if change and obj.pk and "verified_by" in (form.changed_data or []):
+            prev_verified_by_id = (
+                StudentModels.Student.objects.filter(pk=obj.pk)
+                .values_list("verified_by_id", flat=True)
+                .first()
+            )
 
         # Auto-set verified_by to current staff user if not provided
         if not obj.verified_by and request.user.is_staff:
@@ -120,10 +147,49 @@ class StudentAdmin(admin.ModelAdmin):
 
         # If verified_by was newly set or changed, update verification_date
         should_set_date = False
-        if obj.verified_by and (not change or prev_verified_by != obj.verified_by):
+        if obj.verified_by and (not change or prev_verified_by_id != obj.verified_by_id):
             should_set_date = True
 
         if should_set_date:
             obj.verification_date = timezone.now()
 
-        super().save_model(request, obj, form, change)
\ No newline at end of file
+        super().save_model(request, obj, form, change)
+
+
+@admin.register(StudentModels.Fees)
+class FeesAdmin(admin.ModelAdmin):
+    list_display = ["student", "fee_type", "amount", "created_at"]
+    list_filter = ["fee_type"]
+    list_select_related = ("student__parent",)
+    search_fields = [
+        "student__admission_number",
+        "student__first_name",
+        "student__last_name",
+    ]
+    autocomplete_fields = ["student"]
+
+    def get_queryset(self, request):
+        # Fees.__str__ reads the student, e.g. in fee autocomplete results
+        return super().get_queryset(request).select_related("student")
+
+
+class TransactionItemInline(admin.TabularInline):
+    model = StudentModels.TransactionItem
+    extra = 0
+    autocomplete_fields = ["fee"]
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == "fee":
+            kwargs["queryset"] = StudentModels.Fees.objects.select_related("student")
+
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
+@admin.register(StudentModels.Transaction)
+class TransactionAdmin(admin.ModelAdmin):
+    list_display = ["payer", "amount", "transaction_type", "status", "created_at"]
+    list_filter = ["status", "transaction_type"]
+    list_select_related = ("payer",)
+    search_fields = ["payer__email", "payer__first_name", "payer__last_name"]
+    autocomplete_fields = ["payer"]
+    inlines = [TransactionItemInline]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("student", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="student",
+            index=models.Index(
+                fields=["verified_by", "account_status"],
+                name="student_stu_verifie_a63d9a_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["payer", "-created_at"], name="student_tra_payer_i_794af8_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(fields=["status"], name="student_tra_status_5e6088_idx"),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-16 09:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("student", "0002_student_student_stu_verifie_a63d9a_idx_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="student",
+            name="verified_by",
+            field=models.ForeignKey(
+                blank=True,
+                limit_choices_to={"is_staff": True},
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="verified_accounts",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
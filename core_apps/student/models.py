@@ -7,7 +7,7 @@ from decimal import Decimal
 from cloudinary.models import CloudinaryField
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
-from django.db.models import Sum
+from django.db.models import Count, Q, Sum
 
 User = get_user_model()
 
@@ -46,6 +46,7 @@ class Student(TimeStampedModel):
         on_delete=models.SET_NULL,
         blank=True,
         null=True,
+        limit_choices_to={"is_staff": True},
         related_name="verified_accounts",
     )
     verification_date = models.DateTimeField(
@@ -76,6 +77,7 @@ class Student(TimeStampedModel):
     class Meta:
         verbose_name = _("Student")
         verbose_name_plural = _("Students")
+        indexes = [models.Index(fields=["verified_by", "account_status"])]
 
 
 class Fees(TimeStampedModel):
@@ -156,22 +158,29 @@ class Transaction(TimeStampedModel):
             errors["amount"] = _("Amount must be greater than 0.")
         # Validate items: sum of item amounts equals transaction amount and fees belong to payer's children
         if self.pk:  # only possible to check related items after object exists
-            items = self.items.all()
-            if not items.exists():
+            # Item count, amount total and foreign-owner count in one query
+            agg = self.items.aggregate(
+                n=Count("pk"),
+                total=Sum("amount"),
+                bad=Count("pk", filter=~Q(fee__student__parent_id=self.payer_id)),
+            )
+            if not agg["n"]:
                 errors["items"] = _("At least one fee item must be added to the transaction.")
-            total = items.aggregate(total=Sum("amount")).get("total")
-            if total is None or total != self.amount:
+            if agg["total"] is None or agg["total"] != self.amount:
                 errors["items_amount"] = _("Sum of item amounts must equal the transaction amount.")
             # Each item's fee.student.parent must equal payer
-            invalid = [ti for ti in items if ti.fee and ti.fee.student and ti.fee.student.parent != self.payer]
-            if invalid:
+            if agg["bad"]:
                 errors["items_owner"] = _("All fee items must belong to students of the payer.")
         if errors:
             raise ValidationError(errors)
 
     class Meta:
         ordering = ["-created_at"]
-        indexes = [models.Index(fields=["created_at"])]
+        indexes = [
+            models.Index(fields=["created_at"]),
+            models.Index(fields=["payer", "-created_at"]),
+            models.Index(fields=["status"]),
+        ]
 
 
 class TransactionItem(TimeStampedModel):
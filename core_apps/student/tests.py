@@ -0,0 +1,57 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from core_apps.student import models as StudentModels
+from core_apps.student import utils as StudentUtils
+
+User = get_user_model()
+
+
+class CreateStudentAccountsBulkTests(TestCase):
+    def setUp(self):
+        self.parent = User.objects.create(
+            email="parent@example.com",
+            username="TS-PARENT01",
+            first_name="Jane",
+            last_name="Doe",
+            id_no=1001,
+            security_question=User.SecurityQuestions.MAIDEN_NAME,
+            security_answer="Smith",
+        )
+        self.existing = StudentModels.Student.objects.create(
+            parent=self.parent,
+            admission_number="1000000000000001",
+            first_name="First",
+            last_name="Child",
+            gender=StudentModels.Student.Gender.OTHER,
+        )
+
+    def test_retries_rows_skipped_on_admission_number_collision(self):
+        with mock.patch.object(
+            StudentUtils,
+            "generate_admission_number",
+            side_effect=["1000000000000001", "1000000000000002"],
+        ) as generate:
+            students = StudentUtils.create_student_accounts_bulk([self.parent])
+
+        self.assertEqual(generate.call_count, 2)
+        self.assertEqual(len(students), 1)
+        self.assertEqual(students[0].admission_number, "1000000000000002")
+        self.assertTrue(
+            StudentModels.Student.objects.filter(
+                pk=students[0].pk, has_sibling=True
+            ).exists()
+        )
+
+    def test_marks_existing_first_child_as_having_sibling(self):
+        with mock.patch.object(
+            StudentUtils,
+            "generate_admission_number",
+            return_value="1000000000000002",
+        ):
+            StudentUtils.create_student_accounts_bulk([self.parent])
+
+        self.existing.refresh_from_db()
+        self.assertTrue(self.existing.has_sibling)
@@ -1,26 +1,31 @@
 import secrets
 from os import getenv
-from typing import Union, List
 from django.db import transaction, IntegrityError
 from core_apps.student import emails as StudentEmails
 
 from core_apps.student import models as student_models
 
+# Digit sum of 2*d for d in 0..9, used for the doubled Luhn positions
+_DOUBLED = bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9])
+
+# Read once at import; the environment does not change per request
+_SCHOOL_CODE = getenv("SCHOOL_CODE") or ""
+_SCHOOL_CODE_IS_VALID = _SCHOOL_CODE.isdigit()
+
+_GENDER_VALUES = frozenset(student_models.Student.Gender.values)
+
 
 def generate_admission_number(total_length: int = 16) -> str:
-    school_code = getenv("SCHOOL_CODE")
-    if not school_code or not school_code.isdigit():
+    if not _SCHOOL_CODE_IS_VALID:
         raise ValueError("SCHOOL_CODE must be set and numeric.")
 
-    prefix = f"{school_code}"
+    prefix = _SCHOOL_CODE
 
     remaining_digits = total_length - len(prefix) - 1
     if remaining_digits <= 0:
         raise ValueError("SCHOOL_CODE too long for the configured admission number length.")
 
-    random_digits = "".join(
-        secrets.choice("0123456789") for _ in range(remaining_digits)
-    )
+    random_digits = f"{secrets.randbelow(10 ** remaining_digits):0{remaining_digits}d}"
     partial_admission_number = f"{prefix}{random_digits}"
 
     check_digit = calculate_luhn_check_digit(partial_admission_number)
@@ -28,21 +33,55 @@ def generate_admission_number(total_length: int = 16) -> str:
 
 
 def calculate_luhn_check_digit(number: str) -> int:
-    def split_into_digits(n: Union[str, int]) -> List[int]:
-        return [int(digit) for digit in str(n)]
-
-    digits = split_into_digits(number)
+    digits = number.encode("ascii")
     odd_digits = digits[-1::-2]
     even_digits = digits[-2::-2]
-    total = sum(odd_digits)
-
-    for d in even_digits:
-        doubled = d * 2
-        total += sum(split_into_digits(doubled))
+    total = sum(odd_digits) - 48 * len(odd_digits)
+    total += sum(_DOUBLED[d - 48] for d in even_digits)
 
     return (10 - (total % 10)) % 10
 
 
+def _pick_free_admission_number(candidates: int = 4, attempts: int = 3) -> str:
+    for _ in range(attempts):
+        numbers = [generate_admission_number(16) for _ in range(candidates)]
+        taken = set(
+            student_models.Student.objects.filter(
+                admission_number__in=numbers
+            ).values_list("admission_number", flat=True)
+        )
+        for number in numbers:
+            if number not in taken:
+                return number
+
+    raise ValueError("Could not find a free admission number.")
+
+
+def _student_fields(
+    user,
+    first_name: str | None,
+    last_name: str | None,
+    gender: str | None,
+) -> dict:
+    # Apply sensible defaults if not provided
+    if not first_name:
+        first_name = "Student"
+    if not last_name:
+        last_name = (getattr(user, "last_name", None) or "Account")
+    if not gender:
+        gender = student_models.Student.Gender.OTHER
+
+    # Basic gender validation against choices
+    if gender not in _GENDER_VALUES:
+        raise ValueError(f"Invalid gender value. Allowed: {sorted(_GENDER_VALUES)}")
+
+    return {
+        "first_name": first_name.strip().title(),
+        "last_name": last_name.strip().title(),
+        "gender": gender,
+    }
+
+
 def create_student_account(
     user,
     *,
@@ -55,40 +94,98 @@ def create_student_account(
     Requires first_name, last_name, gender to satisfy model constraints.
     Ensures unique admission number with retry and sends email after commit.
     """
-    # Apply sensible defaults if not provided
-    if not first_name:
-        first_name = "Student"
-    if not last_name:
-        last_name = (getattr(user, "last_name", None) or "Account")
-    if not gender:
-        gender = student_models.Student.Gender.OTHER
-
-    # Basic gender validation against choices
-    gender_values = {choice[0] for choice in student_models.Student.Gender.choices}
-    if gender not in gender_values:
-        raise ValueError(f"Invalid gender value. Allowed: {sorted(gender_values)}")
+    fields = _student_fields(user, first_name, last_name, gender)
 
     with transaction.atomic():
-        has_sibling = student_models.Student.objects.filter(parent=user).exists()
+        has_sibling = student_models.Student.objects.filter(parent_id=user.pk).exists()
 
-        # Generate and attempt to create until unique admission_number is persisted
-        while True:
-            admission_number = generate_admission_number(16)
+        # Pick a candidate known to be free, then retry once if a concurrent
+        # insert wins the race for it
+        for attempt in range(2):
+            admission_number = _pick_free_admission_number()
             try:
-                student_account = student_models.Student.objects.create(
-                    parent=user,
-                    admission_number=admission_number,
-                    has_sibling=has_sibling,
-                    first_name=first_name.strip().title(),
-                    last_name=last_name.strip().title(),
-                    gender=gender,
-                )
+                with transaction.atomic():
+                    student_account = student_models.Student.objects.create(
+                        parent=user,
+                        admission_number=admission_number,
+                        has_sibling=has_sibling,
+                        **fields,
+                    )
                 break
             except IntegrityError:
-                # Collision on unique admission_number, retry
-                continue
+                if attempt == 1:
+                    raise
 
         # Defer email until transaction successfully commits
-        transaction.on_commit(lambda: send_account_creation_email(user, student_account))
+        transaction.on_commit(lambda: StudentEmails.send_student_creation_email(user, student_account))
 
-    return student_account
\ No newline at end of file
+    return student_account
+
+
+def create_student_accounts_bulk(
+    users,
+    *,
+    first_name: str | None = None,
+    last_name: str | None = None,
+    gender: str | None = None,
+) -> list[student_models.Student]:
+    """Create one student account per parent user in batched INSERTs.
+
+    Uses the same defaults as create_student_account. Rows whose admission
+    number collides are skipped by the database and retried with new numbers.
+    """
+    users = list(users)
+    fields_by_user = [
+        (user, _student_fields(user, first_name, last_name, gender)) for user in users
+    ]
+
+    with transaction.atomic():
+        parent_ids = [user.pk for user in users]
+        with_students = set(
+            student_models.Student.objects.filter(parent_id__in=parent_ids)
+            .values_list("parent_id", flat=True)
+            .distinct()
+        )
+        batch_counts = {}
+        for parent_id in parent_ids:
+            batch_counts[parent_id] = batch_counts.get(parent_id, 0) + 1
+
+        pending = [
+            student_models.Student(
+                parent=user,
+                has_sibling=user.pk in with_students or batch_counts[user.pk] > 1,
+                **fields,
+            )
+            for user, fields in fields_by_user
+        ]
+        student_accounts = []
+        while pending:
+            for student in pending:
+                student.admission_number = generate_admission_number(16)
+            student_models.Student.objects.bulk_create(pending, ignore_conflicts=True)
+
+            # ignore_conflicts does not report skipped rows; the UUID pks are
+            # assigned client-side, so look them up to find what was inserted
+            inserted = set(
+                student_models.Student.objects.filter(
+                    pk__in=[student.pk for student in pending]
+                ).values_list("pk", flat=True)
+            )
+            student_accounts.extend(s for s in pending if s.pk in inserted)
+            pending = [s for s in pending if s.pk not in inserted]
+
+        # Existing first children now have a sibling too
+        student_models.Student.objects.filter(
+            parent_id__in=with_students, has_sibling=False
+        ).exclude(pk__in=[student.pk for student in student_accounts]).update(
+            has_sibling=True
+        )
+
+        def send_emails() -> None:
+            for student in student_accounts:
+                StudentEmails.send_student_creation_email(student.parent, student)
+
+        # Defer all emails until the batch successfully commits
+        transaction.on_commit(send_emails)
+
+    return student_accounts
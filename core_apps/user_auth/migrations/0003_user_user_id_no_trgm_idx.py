@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-16 09:20
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user_auth", "0002_trigram_extension_user_name_trgm_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast(
+                            "id_no", models.TextField()
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="user_id_no_trgm_idx",
+            ),
+        ),
+    ]
@@ -2,6 +2,8 @@ import uuid
 from django.db import models
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Cast, Upper
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -133,6 +135,23 @@ class User(AbstractUser):
         verbose_name = _("User")
         verbose_name_plural = _("Users")
         ordering = ["-date_joined"]
+        # Trigram indexes over UPPER(...) match the icontains lookups that
+        # SearchFilter issues for profile search. Every searched column needs
+        # one, otherwise the OR of the lookups falls back to a seq scan.
+        indexes = [
+            GinIndex(
+                OpClass(Upper("first_name"), name="gin_trgm_ops"),
+                name="user_first_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("last_name"), name="gin_trgm_ops"),
+                name="user_last_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper(Cast("id_no", models.TextField())), name="gin_trgm_ops"),
+                name="user_id_no_trgm_idx",
+            ),
+        ]
 
     def has_role(self, role_name: str) -> bool:
         return hasattr(self, "role") and self.role == role_name
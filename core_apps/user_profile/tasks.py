@@ -5,6 +5,7 @@ import cloudinary.uploader
 from celery import shared_task
 from django.apps import apps
 from django.core.files.storage import default_storage
+from django.utils.dateparse import parse_datetime
 from loguru import logger
 
 
@@ -35,4 +36,31 @@ def upload_photos_to_cloudinary(profile_id: UUID, photos: dict) -> None:
             if photo_data["type"] == "file" and default_storage.exists(
                 photo_data["path"]
             ):
-                default_storage.delete(photo_data["path"])
\ No newline at end of file
+                default_storage.delete(photo_data["path"])
+
+
+@shared_task(name="record_content_view")
+def record_content_view(
+    content_type_id: int,
+    object_id: str,
+    user_id: str | None,
+    viewer_ip: str | None,
+    viewed_at: str,
+) -> None:
+    content_view_model = apps.get_model("common", "ContentView")
+    last_viewed = parse_datetime(viewed_at)
+    lookup = {
+        "content_type_id": content_type_id,
+        "object_id": object_id,
+        "user_id": user_id,
+        "viewer_ip": viewer_ip,
+    }
+
+    # Repeat views are the common case: try a plain UPDATE first
+    updated = content_view_model.objects.filter(**lookup).update(
+        last_viewed=last_viewed
+    )
+    if not updated:
+        content_view_model.objects.get_or_create(
+            **lookup, defaults={"last_viewed": last_viewed}
+        )
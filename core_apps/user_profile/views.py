@@ -6,6 +6,7 @@ from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
+from loguru import logger
 from rest_framework import status, filters, generics
 from rest_framework import serializers
 from rest_framework.pagination import PageNumberPagination
@@ -13,13 +14,22 @@ from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.request import Request
 
-from core_apps.common.models import ContentView
 from core_apps.common.permissions import *
 from core_apps.student import utils as StudentUtils
 from core_apps.student import models as StudentModel
 from core_apps.common.renderers import GenericJSONRenderer
 from .models import Profile
 from .serializers import ProfileListSerializer, ProfileSerializer
+from .tasks import record_content_view
+
+_PROFILE_CT = None
+
+
+def _profile_ct() -> ContentType:
+    global _PROFILE_CT
+    if _PROFILE_CT is None:
+        _PROFILE_CT = ContentType.objects.get_for_model(Profile)
+    return _PROFILE_CT
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -39,8 +49,24 @@ class ProfileListAPIView(generics.ListAPIView):
     filterset_fields = ["user__first_name", "user__last_name", "user__id_no"]
 
     def get_queryset(self) -> List[Profile]:
-        return Profile.objects.exclude(user__is_staff=True).exclude(
-            user__is_superuser=True
+        # Load only what ProfileListSerializer renders, joining the user row
+        return (
+            Profile.objects.select_related("user")
+            .only(
+                "id",
+                "gender",
+                "nationality",
+                "country_of_birth",
+                "phone_number",
+                "photo",
+                "user",
+                "user__first_name",
+                "user__last_name",
+                "user__username",
+                "user__email",
+            )
+            .exclude(user__is_staff=True)
+            .exclude(user__is_superuser=True)
         )
 
 
@@ -59,20 +85,29 @@ class ProfileDetailAPIView(generics.RetrieveUpdateAPIView):
             raise Http404("Profile does not exist")
 
     def record_profile_view(self, profile: Profile) -> None:
-        content_type = ContentType.objects.get_for_model(profile)
+        content_type = _profile_ct()
         viewer_ip = self.get_client_ip()
         user = self.request.user
 
-        obj, created = ContentView.objects.update_or_create(
-            content_type=content_type,
-            object_id=profile.id,
-            user=user,
-            viewer_ip=viewer_ip,
-            defaults={
-                "last_viewed": timezone.now(),
-            },
+        args = (
+            content_type.id,
+            str(profile.id),
+            str(user.pk),
+            viewer_ip,
+            timezone.now().isoformat(),
         )
 
+        def schedule() -> None:
+            # A broker outage must not fail the profile request
+            try:
+                record_content_view.delay(*args)
+            except Exception as e:
+                logger.error(f"Failed to queue view of profile {profile.id}: {str(e)}")
+
+        # Write the view record off the request path once any open
+        # transaction has committed
+        transaction.on_commit(schedule)
+
     def get_client_ip(self) -> str:
         x_forwarded_for = self.request.META.get("HTTP_X_FORWARDED_FOR")
         if x_forwarded_for:
@@ -112,10 +147,12 @@ class ProfileDetailAPIView(generics.RetrieveUpdateAPIView):
                         last_name=last_name,
                         gender=gender,
                     )
-                    # After creation, mark all students for this parent as having siblings (only if > 1)
-                    qs = StudentModel.Student.objects.filter(parent=updated_instance.user)
-                    if qs.count() > 1:
-                        qs.update(has_sibling=True)
+                    # After creation, flag the parent's other students as having siblings;
+                    # a first child has none, so there is nothing to update
+                    if student_account.has_sibling:
+                        StudentModel.Student.objects.filter(
+                            parent=updated_instance.user, has_sibling=False
+                        ).exclude(pk=student_account.pk).update(has_sibling=True)
                     message = (
                         "Profile updated and new student created successfully. "
                         "An email has been sent to your account."